@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from types import EllipsisType
 from typing import Any, ClassVar, Never, Self, cast, overload, override
 
-from maybetype.errors import MaybeInitError, NothingTypeInitError, ResultInitError, ResultUnwrapError
+from maybetype.errors import MaybeInitError, ResultInitError, ResultUnwrapError
 
 __version__ = '0.14.0'
 
@@ -18,6 +18,7 @@ class Maybe[T]:
     """
 
     __match_args__ = ('_val',)
+    __slots__ = ('__weakref__', '_val')
 
     _val: T
 
@@ -32,10 +33,12 @@ class Maybe[T]:
         return self is not Nothing
 
     def __eq__(self, other: object) -> bool:
-        """Compares the wrapped values if both are ``Maybe``, otherwise returns ``False``."""
+        """Compares the wrapped values if both are ``Maybe``, otherwise returns ``NotImplemented``."""
+        if self is other:
+            return True
         if not isinstance(other, Maybe):
-            return False
-        return self._val == other._val
+            return NotImplemented
+        return self._val is other._val or self._val == other._val
 
     def __hash__(self) -> int:
         """Returns the hash of the wrapped value."""
@@ -49,7 +52,16 @@ class Maybe[T]:
         >>> assert vals == [Some(5), Nothing, Some(10), Nothing]
         >>> assert Maybe.cat(vals) == [5, 10]
         """
-        return [i._val for i in vals if i]  # noqa: SLF001
+        return [i._val for i in vals if i is not Nothing]  # noqa: SLF001
+
+    @staticmethod
+    def icat(vals: Iterable[Maybe[T]]) -> Iterator[T]:
+        """Lazy version of :py:meth:`cat`, returning an iterator over the unwrapped values of the ``Some`` objects.
+
+        >>> vals = iter([maybe(5), maybe(None), maybe(10), maybe(None)])
+        >>> assert sum(Maybe.icat(vals)) == 15
+        """
+        return (i._val for i in vals if i is not Nothing)  # noqa: SLF001
 
     @staticmethod
     def sequence(vals: Iterable[Maybe[T]]) -> Maybe[list[T]]:
@@ -91,9 +103,9 @@ class Maybe[T]:
             value.
         """  # noqa: D205
         try:
-            return Some(getattr(self._val, name) if default is None else getattr(self._val, name, default))
+            return Some(getattr(self._val, name))
         except AttributeError:
-            return Nothing
+            return Nothing if default is None else Some(default)
 
     def cast[U](self, typ: type[U]) -> Maybe[U]:  # noqa: ARG002
         """Returns this instance casted to ``Maybe[typ]``."""
@@ -135,7 +147,8 @@ class Maybe[T]:
         """Attempts to access an item by ``accessor`` on the wrapped object if it supports ``__getitem__``.
 
         If it does not, or if the value does not exist (list index out of range, key does not exist on a dictionary,
-        etc.), ``Nothing`` is returned.
+        etc.), ``Nothing`` is returned. Any other error raised by ``__getitem__`` (e.g. ``TypeError`` for an unhashable
+        key) always propagates.
 
         :param typ: Specifies the generic type of the resulting ``Maybe``. No conversion is performed; this argument is
             only for typing purposes.
@@ -145,15 +158,17 @@ class Maybe[T]:
         """
         default_maybe: Maybe[U] = Nothing if default is ... else Some(default)
 
-        if hasattr(self._val, '__getitem__'):
-            try:
-                return Some(self._val.__getitem__(accessor))  # ty:ignore[call-non-callable]
-            except (IndexError, KeyError):
-                if err:
-                    raise
-                return default_maybe
+        try:
+            getitem = self._val.__getitem__  # ty:ignore[unresolved-attribute]
+        except AttributeError:
+            return default_maybe
 
-        return default_maybe
+        try:
+            return Some(getitem(accessor))
+        except (IndexError, KeyError):
+            if err:
+                raise
+            return default_maybe
 
     def inspect(self, func: Callable[[T], Any]) -> Self:
         """Calls a function with the wrapped value if ``Some``, otherwise does nothing. Returns this instance."""
@@ -241,21 +256,24 @@ class Maybe[T]:
 
         return Ok(Some(self._val._val)) if self._val else Err(self._val._val)  # noqa: SLF001
 
-    def unwrap(self, exc: str | Exception | Callable[[], Never] = 'unwrapped Nothing') -> T:
+    def _unwrap_fail(self, exc: str | BaseException | Callable[[], Never]) -> Never:
+        if isinstance(exc, str):
+            raise ValueError(exc)  # noqa: TRY004
+        if isinstance(exc, BaseException):
+            raise exc
+        if callable(exc):
+            exc()
+        raise ValueError('unwrapped Nothing')
+
+    def unwrap(self, exc: str | BaseException | Callable[[], Never] = 'unwrapped Nothing') -> T:
         """Returns the wrapped value if ``Some``, otherwise raises ``ValueError`` or fails according to ``exc``.
 
         :param exc: If a string is given, ``ValueError`` is raised with the string as its argument.
-            If an ``Exception`` instance is given, it is raised.
+            If an exception instance is given (any ``BaseException``), it is raised.
             If a ``Callable`` is given, it is called with no arguments.
         """
         if not self:
-            if isinstance(exc, str):
-                raise ValueError(exc)
-            if isinstance(exc, Exception):
-                raise exc
-            if isinstance(exc, Callable):
-                exc()
-            raise ValueError('unwrapped Nothing')
+            return self._unwrap_fail(exc)
         return self._val
 
     def unwrap_or(self, other: T) -> T:
@@ -293,6 +311,8 @@ class Maybe[T]:
 class Some[T](Maybe):
     """Subclass of ``Maybe`` representing a present value of type ``T``."""
 
+    __slots__ = ()
+
     def __init__(self, val: T) -> None:
         self._val: T = val
 
@@ -300,24 +320,33 @@ class Some[T](Maybe):
     def __bool__(self) -> bool:
         return True
 
+    @override
+    def unwrap(self, exc: str | BaseException | Callable[[], Never] = 'unwrapped Nothing') -> T:
+        return self._val
+
+    @override
+    def unwrap_or(self, other: T) -> T:
+        return self._val
+
+    @override
+    def unwrap_or_else(self, func: Callable[[], T]) -> T:
+        return self._val
+
 class NothingType(Maybe):
     """Subclass of ``Maybe`` representing no value."""
 
     __match_args__ = ()
+    __slots__ = ()
 
-    _exists: ClassVar[bool] = False
+    _instance: ClassVar[NothingType | None] = None
 
     def __new__(cls, _: None = None) -> Self:
-        """Creates a new ``NothingType`` instance only if one does not exist.
-
-        :raises NothingTypeInitError:
-            A ``NothingType`` instance already exists (the ``_exists`` classvar is ``True``).
-        """
-        if cls._exists:
-            raise NothingTypeInitError('Cannot instance a second NothingType, use the Nothing singleton')
-        cls._exists = True
-
-        return super().__new__(cls)
+        """Creates a new ``NothingType`` instance only if one does not exist, otherwise returns the existing
+        ``Nothing`` singleton.
+        """  # noqa: D205
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cast('Self', cls._instance)
 
     def __init__(self) -> None:
         """The ``_val`` attribute of ``NothingType`` is irrelevant, so ``__init__`` accepts no parameters."""
@@ -332,26 +361,52 @@ class NothingType(Maybe):
     def __bool__(self) -> bool:
         return False
 
+    # ``Nothing`` is a singleton, so the default identity hash is all that's needed
+    __hash__ = object.__hash__
+
     @override
-    def __hash__(self) -> int:
-        """Returns the hash of the ``NothingType`` class."""
-        return hash(NothingType)
+    def and_then[U](self, func: Callable[[Any], Maybe[U]]) -> NothingType:
+        return self
+
+    @override
+    def map[U](self, func: Callable[[Any], U]) -> NothingType:
+        return self
+
+    @override
+    def then[U](self, func: Callable[[Any], U]) -> None:
+        return None
+
+    @override
+    def unwrap(self, exc: str | BaseException | Callable[[], Never] = 'unwrapped Nothing') -> Never:
+        return self._unwrap_fail(exc)
+
+    @override
+    def unwrap_or[T](self, other: T) -> T:
+        return other
+
+    @override
+    def unwrap_or_else[T](self, func: Callable[[], T]) -> T:
+        return func()
 
 Nothing = NothingType()
 
 @overload
-def maybe[T](val: None, predicate: Callable[[T], bool] = lambda v: v is not None) -> NothingType: ...
+def maybe[T](val: None, predicate: Callable[[T], bool] | None = None) -> NothingType: ...
 @overload
-def maybe[T](val: T | None, predicate: Callable[[T], bool] = lambda v: v is not None) -> Maybe[T]: ...
-def maybe[T](val: T | None, predicate: Callable[[T], bool] = lambda v: v is not None) -> Maybe[T]:
+def maybe[T](val: T | None, predicate: Callable[[T], bool] | None = None) -> Maybe[T]: ...
+def maybe[T](val: T | None, predicate: Callable[[T], bool] | None = None) -> Maybe[T]:
     """Returns ``Nothing`` if ``val`` is ``None`` or ``not predicate(val)``, otherwise returns ``Some(val)``.
 
     :param val: A value to wrap.
     :param predicate: A function that must return ``True`` for ``predicate(val)`` in addition to ``val`` not being
         ``None`` in order for a ``Some`` to be returned; ``maybe(val, predicate)`` is then effectively shorthand for
-        ``maybe(val).filter(predicate)``.
+        ``maybe(val).filter(predicate)``. If ``None`` (default), only the ``None`` check is performed.
     """
-    return Nothing if (val is None) or not predicate(val) else Some(val)
+    if val is None:
+        return Nothing
+    if predicate is not None and not predicate(val):
+        return Nothing
+    return Some(val)
 
 def maybe_exc[T](
         fn: Callable[[], T],
@@ -515,7 +570,7 @@ class Result[T, E]:
             raise ResultUnwrapError(f'{exc}: {self._val!r}')
         if isinstance(exc, type) and issubclass(exc, Exception):
             raise exc(repr(self._val))
-        if isinstance(exc, Callable):
+        if callable(exc):
             exc(cast('E', self._val))
         raise TypeError(f'Unexpected type for unwrap argument exc: {exc!r}')
 
@@ -3,7 +3,11 @@
 class MaybeInitError(Exception):
     """Raised when creating a ``Maybe`` object directly."""
 class NothingTypeInitError(Exception):
-    """Raised when calling ``NothingType.__init__()`` for a second time instead of using the ``Nothing`` singleton."""
+    """Formerly raised when calling ``NothingType()`` for a second time.
+
+    ``NothingType()`` now returns the ``Nothing`` singleton instead, so this is no longer raised and is only kept for
+    backwards compatibility.
+    """
 class ResultInitError(Exception):
     """Raised when creating a ``Result`` object directly."""
 class ResultUnwrapError(Exception):
@@ -1,15 +1,18 @@
 import re
+import weakref
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from string import ascii_lowercase
+from typing import Never
 
 import pytest  # ty:ignore[unresolved-import, unused-ignore-comment]; seems to only show up in workflow runs?
 
 from maybetype import Err, Maybe, Nothing, NothingType, Ok, Some, maybe, maybe_exc
-from maybetype.errors import MaybeInitError, NothingTypeInitError
+from maybetype.errors import MaybeInitError
 
 ALPHANUMERIC: str = ascii_lowercase + '0123456789'
-MAYBE_UNWRAP_NONE_REGEX: re.Pattern[str] = re.compile(r'unwrapped Nothing')
+MAYBE_UNWRAP_NONE_REGEX: re.Pattern[str] = re.compile(r'\Aunwrapped Nothing\Z')
+UUID_REGEX: re.Pattern[str] = re.compile(r'[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}|[0-9a-f]{32}')
 
 def try_int(s: str) -> Maybe[int]:
     return Some(int(s)) if s.isdigit() else Nothing
@@ -36,9 +39,13 @@ def test_unwrap_nothing_callback() -> None:
         Nothing.unwrap(TypeError('Nothing'))
     with pytest.raises(SystemExit):
         Nothing.unwrap(exit)
+    with pytest.raises(SystemExit):
+        Nothing.unwrap(SystemExit(1))
 
 def test_maybe_none_is_nothing() -> None:
     assert maybe(None) is Nothing
+    assert maybe(None, lambda _: True) is Nothing
+    assert maybe(0, None) == Some(0)
 
 def test_some_none_ok() -> None:
     assert isinstance(Some(None), Some)
@@ -48,10 +55,12 @@ def test_equality() -> None:
     assert maybe(1) == Some(1)
     assert maybe(1) != Some(2)
     assert maybe(1) != Nothing
+    assert Nothing == Nothing  # noqa: PLR0124
+    assert Some(1) != 1
+    assert Some(1).__eq__(1) is NotImplemented
 
-def test_nothingtype_init_error() -> None:
-    with pytest.raises(NothingTypeInitError):
-        NothingType()
+def test_nothingtype_is_singleton() -> None:
+    assert NothingType() is Nothing
 
 def test_maybe_or() -> None:
     assert (try_int('10') or Some(0)).unwrap() == 10  # noqa: PLR2004
@@ -117,6 +126,10 @@ def test_maybe_attr() -> None:
     assert m_none.attr('x') is Nothing
     assert m_none.attr('x', 2).unwrap() == 2  # noqa: PLR2004
 
+class TypeErrorGetitem:  # noqa: D101
+    def __getitem__(self, key: object) -> Never:  # noqa: D105
+        raise TypeError(f'bad key: {key!r}')
+
 @pytest.mark.parametrize(('val', 'accessor', 'result', 'err'),
     [
         (0,                1,   Nothing, None),
@@ -150,16 +163,60 @@ def test_maybe_get(val: object, accessor: object, result: object, err: type[Exce
         with pytest.raises(err):
             m.get(accessor, err=True)
 
+@pytest.mark.parametrize(('val', 'accessor'),
+    [
+        ([1, 2],             'a'),
+        ({},                 [1]),
+        (TypeErrorGetitem(), 0),
+    ],
+    ids=[
+        'list_str_index',
+        'dict_unhashable_key',
+        'getitem_raises_typeerror',
+    ],
+)
+def test_maybe_get_type_error(val: object, accessor: object) -> None:
+    m: Maybe = maybe(val)
+
+    with pytest.raises(TypeError):
+        m.get(accessor)
+    with pytest.raises(TypeError):
+        m.get(accessor, err=True)
+    with pytest.raises(TypeError):
+        m.get(accessor, default=0)
+
+def test_maybe_get_type_objects() -> None:
+    # Classes are not subscripted through __class_getitem__
+    assert Some(Maybe).get(int) is Nothing
+    with pytest.raises(TypeError):
+        Some(list).get(int)
+
+def test_maybe_get_instance_getitem() -> None:
+    class A:
+        pass
+
+    a = A()
+    a.__getitem__ = lambda key: key  # ty:ignore[unresolved-attribute]
+    assert Some(a).get(3) == Some(3)
+
 def test_maybe_cat() -> None:
     assert Maybe.cat((Some(1), Some('one'), Nothing, Some(2))) == [1, 'one', 2]
     assert Maybe.cat(map(try_int, ALPHANUMERIC)) == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert Maybe.cat((Some(0), Some(''), Some(None), Nothing)) == [0, '', None]
+
+def test_maybe_icat() -> None:
+    it = Maybe.icat(map(try_int, ALPHANUMERIC))
+    assert not isinstance(it, list)
+    assert next(it) == 0
+    assert list(it) == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert list(Maybe.icat((Some(0), Nothing, Some(None)))) == [0, None]
 
 def test_maybe_cat_failure() -> None:
     with pytest.raises(AttributeError, match="has no attribute '_val'"):
         Maybe.cat([1, 2, 3])  # ty:ignore[invalid-argument-type]
 
 def is_valid_uuid(s: str) -> bool:
-    return re.match(r'[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}|[0-9a-f]{32}', s) is not None
+    return UUID_REGEX.fullmatch(s) is not None
 
 @pytest.mark.parametrize(('value', 'predicate', 'expected_bool'),
     [
@@ -172,6 +229,7 @@ def is_valid_uuid(s: str) -> bool:
         ('3b1bcc3a41d549a5827310cc605e31f9', is_valid_uuid, True),
         ('qwertyuiopasdfghjklzxcvbnm', is_valid_uuid, False),
         ('nf0cmmdq-l0gt-rq5a-upry-706trht3ocv9', is_valid_uuid, False),
+        ('3b1bcc3a41d549a5827310cc605e31f9-suffix', is_valid_uuid, False),
     ],
 )
 def test_maybe_with_predicate_and_filter[T](value: T, predicate: Callable[[T], bool], expected_bool: bool) -> None:
@@ -194,6 +252,7 @@ def test_maybe_with_predicate_and_filter[T](value: T, predicate: Callable[[T], b
         ('3b1bcc3a41d549a5827310cc605e31f9', is_valid_uuid, ...),
         ('qwertyuiopasdfghjklzxcvbnm', is_valid_uuid, None),
         ('nf0cmmdq-l0gt-rq5a-upry-706trht3ocv9', is_valid_uuid, None),
+        ('3b1bcc3a41d549a5827310cc605e31f9-suffix', is_valid_uuid, None),
     ],
 )
 def test_pattern_matching[T](value: T, predicate: Callable[[T], bool], expected: T | None) -> None:
@@ -363,3 +422,14 @@ def test_hash() -> None:
     assert hash(Some(1))
     assert hash(Nothing)
     assert hash(Some(None)) != hash(Nothing)
+    assert hash(Nothing) == hash(NothingType())
+    assert {Some(1): 'a', Nothing: 'b'}[Nothing] == 'b'
+
+def test_no_instance_dict() -> None:
+    assert not hasattr(Some(1), '__dict__')
+    assert not hasattr(Nothing, '__dict__')
+
+def test_weakref() -> None:
+    s = Some(1)
+    assert weakref.ref(s)() is s
+    assert weakref.ref(Nothing)() is Nothing